@@ -1,17 +1,107 @@
 #!/usr/bin/env python3
 """
 Build the search index from all memory files.
-Usage: python build-index.py
+Usage: python build-index.py [--force]
+
+The rebuild is skipped when no memory file (or index.json) has changed
+since the search index was last written.
 """
 
+import argparse
+import json
+import os
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "lib"))
 
-from memory_lib import build_search_index, SEARCH_INDEX_FILE
+# search-index.json is the largest file the plugin writes; encode it
+# with orjson when that happens to be installed
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+from memory_lib import (
+    build_search_index, load_index,
+    GLOBAL_MEMORIES_DIR, PROJECTS_DIR, INDEX_FILE, SEARCH_INDEX_FILE
+)
+
+
+def changed_since(mtime_ns: int) -> bool:
+    """
+    Check whether any memory file or index.json changed at or after mtime_ns.
+
+    Directory mtimes are checked too, so deleted memory files count as changes.
+    """
+    try:
+        if INDEX_FILE.stat().st_mtime_ns >= mtime_ns:
+            return True
+    except FileNotFoundError:
+        pass
+
+    for root in (GLOBAL_MEMORIES_DIR, PROJECTS_DIR):
+        for dirpath, _, filenames in os.walk(root):
+            if os.stat(dirpath).st_mtime_ns >= mtime_ns:
+                return True
+            for name in filenames:
+                if name.endswith(".json") and os.stat(os.path.join(dirpath, name)).st_mtime_ns >= mtime_ns:
+                    return True
+
+    return False
+
+
+def build_promotion_candidates(index: dict) -> list:
+    """
+    List index entries sorted by confidence (highest first).
+
+    Lets promotion stop at the first entry below its threshold instead of
+    scanning every memory. Only confidence is carried over; the remaining
+    criteria are checked on the loaded memory. "position" keeps the entry's
+    original index order.
+    """
+    rows = []
+
+    def add(entry: dict, project_hash=None) -> None:
+        rows.append({
+            "id": entry["id"],
+            "position": len(rows),
+            "confidence": entry.get("confidence", 0),
+            "project_hash": project_hash
+        })
+
+    for entry in index["memories"]["global"]:
+        add(entry)
+    for project_hash, project in index["memories"]["projects"].items():
+        for entry in project.get("memories", []):
+            add(entry, project_hash)
+
+    rows.sort(key=lambda row: row["confidence"], reverse=True)
+    return rows
+
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the memory search index")
+    parser.add_argument("--force", action="store_true",
+                        help="Rebuild even if no memory files have changed")
+    args = parser.parse_args()
+
+    if not args.force and SEARCH_INDEX_FILE.exists():
+        if not changed_since(SEARCH_INDEX_FILE.stat().st_mtime_ns):
+            os.utime(SEARCH_INDEX_FILE)  # Mark as checked for maintenance.sh
+            print(f"Search index is up to date: {SEARCH_INDEX_FILE}")
+            sys.exit(0)
+
     print("Building search index...")
     index = build_search_index()
+
+    index["promotion_candidates"] = build_promotion_candidates(load_index())
+    tmp_file = SEARCH_INDEX_FILE.with_suffix(".json.tmp")
+    tmp_file.write_bytes(_json_dumps(index))
+    os.replace(tmp_file, SEARCH_INDEX_FILE)
+
     print(f"Indexed {len(index['terms'])} terms and {len(index['tags'])} tags")
     print(f"Index saved to {SEARCH_INDEX_FILE}")
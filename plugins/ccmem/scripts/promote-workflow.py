@@ -10,13 +10,17 @@ Usage:
 """
 
 import argparse
+import collections
+import functools
+import itertools
 import json
 import os
 import re
+import stat
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 
 # Add lib directory to path
 sys.path.insert(0, str(Path(__file__).parent / "lib"))
@@ -41,6 +45,60 @@ GLOBAL_CLAUDE_MD = Path.home() / ".claude" / "CLAUDE.md"
 MIN_CONFIDENCE = 0.8
 MIN_POSITIVE_RATIO = 0.7
 
+# CLAUDE.md contents read this run: path -> ((mtime_ns, size), content)
+_claude_md_cache: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+
+# Indexed CLAUDE.md contents: path -> (content, index)
+_claude_md_index_cache: Dict[Path, Tuple[str, Dict[str, Any]]] = {}
+
+# Common words ignored when comparing memories with CLAUDE.md content
+_STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'use', 'when', 'with', 'should', 'from', 'that',
+    'this', 'have', 'will', 'your', 'prefer', 'default', 'instead', 'always',
+    'never', 'avoid', 'suggest'
+})
+
+# CLAUDE.md section for each memory type, in the order sections are laid out
+# (interned so repeated name comparisons are mostly identity checks)
+_SECTION_MAP = {
+    memory_type: sys.intern(section_name)
+    for memory_type, section_name in (
+        ('preference', 'Preferences'),
+        ('pattern', 'Patterns & Conventions'),
+        ('workflow', 'Workflows'),
+        ('project', 'Project-Specific'),
+        ('correction', 'Learned Corrections'),
+        ('negative', 'Avoid'),
+    )
+}
+_TYPE_ORDER = tuple(_SECTION_MAP.values())
+_TYPE_INDEX = {section_name: i for i, section_name in enumerate(_TYPE_ORDER)}
+
+# Shortest text that can hold two distinct keywords ("abc def")
+_MIN_OVERLAP_LEN = 7
+
+# Precompiled patterns
+_KEYWORD_RE = re.compile(r'\b[a-z]{3,}\b')
+_TITLE_RE = re.compile(r'^\s*[-*]\s*\*\*([^*]+)\*\*', re.MULTILINE)
+_MARKER_RE = re.compile(r'<!--\s*memory-sync:.*?-->', re.DOTALL)
+# Header patterns below run over whole content in MULTILINE mode; [^\S\n]
+# (whitespace except newline) keeps each match within a single line
+_SECTION_RE = re.compile(r'^(#{2,3})[^\S\n]+(.+)$', re.MULTILINE)
+_ANY_SECTION_RE = re.compile(r'^(#{2,})[^\S\n]', re.MULTILINE)
+_LEVEL2_NAME_RE = re.compile(r'^##[^\S\n]+(.*?)[^\S\n]*$', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=64)
+def _section_header_re(section_name: str) -> re.Pattern:
+    """Pattern matching a level-2 header line for section_name."""
+    return re.compile(rf'^##[^\S\n]+{re.escape(section_name)}[^\S\n]*$', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=64)
+def _section_header_any_level_re(section_name: str) -> re.Pattern:
+    """Pattern matching a header line of level 2 or deeper for section_name."""
+    return re.compile(rf'^(#{{2,}})[^\S\n]+{re.escape(section_name)}[^\S\n]*$', re.MULTILINE)
+
 
 def find_claude_md(project_path: Optional[str] = None, scope_type: str = "global") -> Optional[Path]:
     """
@@ -50,26 +108,26 @@ def find_claude_md(project_path: Optional[str] = None, scope_type: str = "global
     1. If project_path provided: {project}/CLAUDE.md or {project}/.claude/CLAUDE.md
     2. Walk up from current directory
     3. Global ~/.claude/CLAUDE.md
+
+    Results are cached per (project_path, cwd) for the duration of the run.
     """
+    return _find_claude_md_cached(project_path, str(Path.cwd()))
+
+
+@functools.lru_cache(maxsize=32)
+def _find_claude_md_cached(project_path: Optional[str], cwd: str) -> Optional[Path]:
+    """Uncached lookup behind find_claude_md()."""
     # Check project path first
     if project_path:
         project = Path(project_path).resolve()
-        candidates = [
-            project / ".claude" / "CLAUDE.md",
-            project / "CLAUDE.md"
-        ]
-        for candidate in candidates:
+        for candidate in (project / ".claude" / "CLAUDE.md", project / "CLAUDE.md"):
             if candidate.exists():
                 return candidate
 
-    # Walk up from current directory
-    cwd = Path.cwd().resolve()
-    for parent in [cwd] + list(cwd.parents):
-        candidates = [
-            parent / ".claude" / "CLAUDE.md",
-            parent / "CLAUDE.md"
-        ]
-        for candidate in candidates:
+    # Walk up from current directory, stopping at the first match
+    cwd_path = Path(cwd).resolve()
+    for parent in itertools.chain((cwd_path,), cwd_path.parents):
+        for candidate in (parent / ".claude" / "CLAUDE.md", parent / "CLAUDE.md"):
             if candidate.exists():
                 return candidate
 
@@ -96,209 +154,285 @@ def get_claude_md_for_scope(scope_type: str, scope_path: Optional[str] = None) -
 
 def extract_keywords(text: str) -> List[str]:
     """Extract significant keywords from text."""
-    # Convert to lowercase, remove special chars, split
-    words = re.findall(r'\b[a-z]{3,}\b', text.lower())
-    # Filter common stop words
-    stop_words = {'the', 'and', 'for', 'use', 'use', 'when', 'with', 'should',
-                  'from', 'that', 'this', 'have', 'will', 'your', 'prefer',
-                  'default', 'instead', 'always', 'never', 'avoid', 'suggest'}
-    return [w for w in words if w not in stop_words]
+    # Lowercase, split into words, drop common stop words
+    return [w for w in _KEYWORD_RE.findall(text.lower()) if w not in _STOP_WORDS]
+
+
+def _keyword_signature(keywords: set) -> int:
+    """
+    64-bit signature with one bit set per keyword (by hash).
+
+    Sets sharing a keyword always share a bit, so signatures that AND to
+    zero prove two keyword sets are disjoint without intersecting them.
+    """
+    signature = 0
+    for keyword in keywords:
+        signature |= 1 << (hash(keyword) & 63)
+    return signature
 
 
 def extract_memory_titles(content: str) -> List[str]:
     """Extract existing memory titles from CLAUDE.md content."""
-    titles = []
     # Match bold titles in bullet points: - **Title**
-    pattern = r'^\s*[-*]\s*\*\*([^*]+)\*\*'
-    for match in re.finditer(pattern, content, re.MULTILINE):
-        titles.append(match.group(1).strip())
-    return titles
+    return [match.group(1).strip() for match in _TITLE_RE.finditer(content)]
 
 
-def parse_claude_md_sections(content: str) -> List[Dict[str, Any]]:
-    """Parse CLAUDE.md into sections."""
-    sections = []
+# A titled CLAUDE.md section; its body is content[start:end] (unstripped)
+SectionSpan = collections.namedtuple('SectionSpan', 'title start end level')
 
-    # Remove markers (for backward compatibility)
-    content = re.sub(r'<!--\s*memory-sync:.*?-->', '', content, flags=re.DOTALL)
-
-    # Match section headers (## or ###)
-    section_pattern = r'^(#{2,3})\s+(.+)$'
-
-    current_section = None
-    current_content = []
-
-    for line in content.split('\n'):
-        match = re.match(section_pattern, line)
-        if match:
-            # Save previous section
-            if current_section:
-                sections.append({
-                    'title': current_section,
-                    'content': '\n'.join(current_content).strip(),
-                    'level': len(match.group(1))
-                })
-            current_section = match.group(2).strip()
-            current_content = []
-        else:
-            current_content.append(line)
 
-    # Don't forget the last section
-    if current_section:
-        sections.append({
-            'title': current_section,
-            'content': '\n'.join(current_content).strip(),
-            'level': 2
-        })
+def iter_sections(content: str) -> Iterator[SectionSpan]:
+    """
+    Yield the titled ## and ### sections of content as offsets.
+
+    Markers are not removed here; pass marker-free content (see
+    parse_claude_md_sections()).
+    """
+    prev = None
+    for header in _SECTION_RE.finditer(content):
+        if prev is not None:
+            yield from _section_span(prev, header.start())
+        prev = header
+
+    if prev is not None:
+        # Last section runs to the end
+        yield from _section_span(prev, len(content))
+
+
+def _section_span(header: re.Match, end: int) -> Iterator[SectionSpan]:
+    """Span for the section under header, if it has a title."""
+    title = header.group(2).strip()
+    if title:
+        # Body starts after the header line's newline
+        yield SectionSpan(title, header.end() + 1, end, len(header.group(1)))
+
 
-    return sections
+def parse_claude_md_sections(content: str) -> List[Dict[str, Any]]:
+    """Parse CLAUDE.md into sections."""
+    # Remove markers (for backward compatibility)
+    content = _MARKER_RE.sub('', content)
+
+    return [
+        {
+            'title': span.title,
+            'content': content[span.start:span.end].strip(),
+            'level': span.level
+        }
+        for span in iter_sections(content)
+    ]
 
 
-def check_duplicate(memory: Dict[str, Any], claude_md_content: str) -> Tuple[str, Optional[str]]:
+def _index_claude_md(content: str) -> Dict[str, Any]:
     """
-    Check if memory is duplicate of existing content.
+    Extract titles and sections from CLAUDE.md content, with their keywords.
 
-    Returns:
-        (status, matched_title): status is 'exact', 'similar', or 'new'
+    Built once per file so duplicate/overlap checks for every candidate
+    reuse it instead of re-parsing the content.
     """
-    existing_titles = extract_memory_titles(claude_md_content)
+    titles = extract_memory_titles(content)
+
+    # Overlap needs 2 shared keywords, so only sections with 2+ keywords
+    # can overlap; bodies too short to hold two aren't tokenized
+    # (bodies are only sliced out for sections that pass the length check)
+    overlap_sections = []
+    unmarked = _MARKER_RE.sub('', content)
+    for span in iter_sections(unmarked):
+        if span.end - span.start < _MIN_OVERLAP_LEN:
+            continue
+        body = unmarked[span.start:span.end].strip()
+        if len(body) < _MIN_OVERLAP_LEN:
+            continue
+        keywords = set(extract_keywords(body))
+        if len(keywords) >= 2:
+            overlap_sections.append(({'title': span.title, 'content': body}, keywords))
+
+    title_kws = [set(extract_keywords(title)) for title in titles]
+    return {
+        'titles': titles,
+        'title_set': frozenset(titles),
+        'title_kws': title_kws,
+        'title_sigs': [_keyword_signature(keywords) for keywords in title_kws],
+        'overlap_sections': overlap_sections
+    }
 
-    memory_title = memory['content'].get('title', '').strip()
 
-    # Exact match
-    if memory_title in existing_titles:
-        return 'exact', memory_title
+def _read_claude_md(target_path: Path) -> str:
+    """Read a CLAUDE.md file, reusing the last read while the file is unchanged."""
+    st = target_path.stat()
+    version = (st.st_mtime_ns, st.st_size)
+    cached = _claude_md_cache.get(target_path)
+    if cached and cached[0] == version:
+        return cached[1]
 
-    # Semantic similarity - keyword overlap
-    memory_keywords = set(extract_keywords(memory_title))
-    if not memory_keywords:
-        return 'new', None
+    content = target_path.read_text()
+    _claude_md_cache[target_path] = (version, content)
+    return content
 
-    for title in existing_titles:
-        title_keywords = set(extract_keywords(title))
-        if not title_keywords:
-            continue
 
-        intersection = memory_keywords & title_keywords
-        union = memory_keywords | title_keywords
+def get_claude_md_index(target_path: Path) -> Dict[str, Any]:
+    """Get the (cached) index of a CLAUDE.md file; rebuilt when the file changes."""
+    content = _read_claude_md(target_path)
+    cached = _claude_md_index_cache.get(target_path)
+    if cached and cached[0] is content:
+        return cached[1]
 
-        if union:
-            overlap = len(intersection) / len(union)
-            if overlap > 0.7:  # 70% keyword overlap
-                return 'similar', title
+    index = _index_claude_md(content)
+    _claude_md_index_cache[target_path] = (content, index)
+    return index
 
-    return 'new', None
 
+def analyze_claude_md(
+    memory: Dict[str, Any],
+    index: Dict[str, Any],
+    overlap_limit: int = 3
+) -> Tuple[str, Optional[str], List[Dict[str, Any]]]:
+    """
+    Check a memory against existing CLAUDE.md content in one pass.
 
-def check_overlaps(memory: Dict[str, Any], claude_md_content: str) -> List[Dict[str, Any]]:
-    """Detect if memory overlaps with existing CLAUDE.md content."""
-    overlaps = []
+    Args:
+        memory: Candidate memory
+        index: CLAUDE.md index from get_claude_md_index()
+        overlap_limit: Stop after this many overlapping sections (0 skips the check)
+
+    Returns:
+        (status, matched_title, overlaps): status is 'exact', 'similar', or 'new';
+        overlaps lists up to overlap_limit sections sharing at least 2 keywords
+        with the memory
+    """
+    memory_title = memory['content'].get('title', '').strip()
+    title_words = extract_keywords(memory_title)
+    title_keywords = set(title_words)
+    # Same keywords as extracting from "title description"
+    memory_keywords = set(title_words + extract_keywords(memory['content'].get('description', '')))
+
+    # Exact match
+    if memory_title in index['title_set']:
+        dup_status, dup_match = 'exact', memory_title
+    else:
+        dup_status, dup_match = 'new', None
+        # Semantic similarity - keyword overlap
+        if title_keywords:
+            n_title = len(title_keywords)
+            title_sig = _keyword_signature(title_keywords)
+            for title, keywords, sig in zip(index['titles'], index['title_kws'], index['title_sigs']):
+                n_keywords = len(keywords)
+                # Jaccard can't exceed min/max of the set sizes, and is 0 for
+                # disjoint signatures
+                if (not n_keywords or not title_sig & sig
+                        or 10 * min(n_title, n_keywords) <= 7 * max(n_title, n_keywords)):
+                    continue
+
+                # |A & B| / |A | B| > 0.7 in integers, without building the union
+                shared = len(title_keywords & keywords)
+                if 10 * shared > 7 * (n_title + n_keywords - shared):  # 70% keyword overlap
+                    dup_status, dup_match = 'similar', title
+                    break
 
-    # Get memory keywords
-    memory_text = f"{memory['content'].get('title', '')} {memory['content'].get('description', '')}"
-    memory_keywords = set(extract_keywords(memory_text))
+    overlaps = []
+    if memory_keywords and overlap_limit > 0:
+        for section, section_keywords in index['overlap_sections']:
+            # Check for keyword overlap
+            overlap = memory_keywords & section_keywords
+            if len(overlap) >= 2:  # At least 2 shared keywords
+                overlaps.append({
+                    'section_title': section['title'],
+                    'overlap_keywords': list(overlap)[:5],  # Limit to 5
+                    'content_preview': section['content'][:200] + '...' if len(section['content']) > 200 else section['content']
+                })
+                if len(overlaps) >= overlap_limit:
+                    break
 
-    if not memory_keywords:
-        return overlaps
+    return dup_status, dup_match, overlaps
 
-    # Parse sections
-    sections = parse_claude_md_sections(claude_md_content)
 
-    for section in sections:
-        section_keywords = set(extract_keywords(section['content']))
+def check_duplicate(memory: Dict[str, Any], index: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    """Check if memory is duplicate of existing content (see analyze_claude_md())."""
+    dup_status, dup_match, _ = analyze_claude_md(memory, index, overlap_limit=0)
+    return dup_status, dup_match
 
-        # Check for keyword overlap
-        overlap = memory_keywords & section_keywords
-        if len(overlap) >= 2:  # At least 2 shared keywords
-            overlaps.append({
-                'section_title': section['title'],
-                'overlap_keywords': list(overlap)[:5],  # Limit to 5
-                'content_preview': section['content'][:200] + '...' if len(section['content']) > 200 else section['content']
-            })
 
-    return overlaps
+def check_overlaps(memory: Dict[str, Any], index: Dict[str, Any], limit: int = 3) -> List[Dict[str, Any]]:
+    """Detect if memory overlaps with existing CLAUDE.md content (see analyze_claude_md())."""
+    return analyze_claude_md(memory, index, overlap_limit=limit)[2]
 
 
 def format_memory_entry(memory: Dict[str, Any]) -> str:
     """Format a memory as clean markdown (NO markers)."""
     content = memory['content']
 
-    lines = [
-        f"- **{content['title']}**",
-        f"  - {content['description']}",
-    ]
+    entry = f"- **{content['title']}**\n  - {content['description']}"
 
     if content.get('action'):
-        lines.append(f"  - {content['action']}")
+        entry += f"\n  - {content['action']}"
 
     if content.get('examples'):
-        for example in content['examples'][:3]:  # Limit to 3 examples
-            lines.append(f"  - Example: `{example}`")
+        # Limit to 3 examples
+        entry += ''.join(f"\n  - Example: `{example}`" for example in content['examples'][:3])
 
-    return '\n'.join(lines)
+    return entry
 
 
 def section_exists(content: str, section_name: str) -> bool:
     """Check if a section exists in CLAUDE.md content."""
-    pattern = rf'^##\s+{re.escape(section_name)}\s*$'
-    return bool(re.search(pattern, content, re.MULTILINE))
+    return bool(_section_header_re(section_name).search(content))
 
 
-def insert_into_section(content: str, section_name: str, entry: str) -> str:
-    """Insert memory entry into existing section."""
-    lines = content.split('\n')
-    result = []
-    in_target_section = False
-    section_level = 2
-    inserted = False
-
-    for i, line in enumerate(lines):
-        # Check if this is the target section header
-        if re.match(rf'^##\s+{re.escape(section_name)}\s*$', line):
-            in_target_section = True
-            section_level = 2
-            result.append(line)
+def _find_section_end(content: str, header_re: re.Pattern, pos: int, level: int) -> Optional[int]:
+    """
+    Find where the section whose header line ends at pos stops.
+
+    Returns the offset of the next header at the same or a higher level
+    (repeats of the section's own header don't end it), or None if the
+    section runs to the end of content.
+    """
+    match_header = header_re.match
+    # Only the any-level pattern captures the header's level
+    tracks_level = header_re.groups > 0
+
+    for match in _ANY_SECTION_RE.finditer(content, pos):
+        repeat = match_header(content, match.start())
+        if repeat:
+            if tracks_level:
+                level = len(repeat.group(1))
             continue
+        if len(match.group(1)) <= level:
+            return match.start()
+    return None
 
-        # Check if we're leaving the section (new section at same or higher level)
-        if in_target_section and not inserted:
-            next_section_match = re.match(r'^(#{2,})\s+', line)
-            if next_section_match and len(next_section_match.group(1)) <= section_level:
-                # Insert before this line
-                result.append(entry)
-                result.append('')
-                inserted = True
-                in_target_section = False
 
-        result.append(line)
+def insert_into_section(content: str, section_name: str, entry: str) -> str:
+    """Insert memory entry into existing section."""
+    header_re = _section_header_re(section_name)
+    header = header_re.search(content)
+    if not header:
+        return content
 
-    # If we reached the end and haven't inserted, append
-    if in_target_section and not inserted:
-        result.append('')
-        result.append(entry)
+    boundary = _find_section_end(content, header_re, header.end(), 2)
+    if boundary is None:
+        # Section runs to the end, append
+        return content + '\n\n' + entry
 
-    return '\n'.join(result)
+    # Insert before the next section
+    return content[:boundary] + entry + '\n\n' + content[boundary:]
 
 
 def create_section(content: str, section_name: str, entry: str) -> str:
     """Create a new section and add the entry."""
     # Find appropriate location - add after existing sections or at end
-    sections = parse_claude_md_sections(content)
+    has_sections = next(iter_sections(_MARKER_RE.sub('', content)), None) is not None
 
-    if not sections:
+    if not has_sections:
         # No existing sections, add at end
         return content.rstrip() + f"\n\n## {section_name}\n\n{entry}\n"
 
     # Add after the last section of similar type
-    type_order = ['Preferences', 'Patterns & Conventions', 'Workflows',
-                  'Project-Specific', 'Learned Corrections', 'Avoid']
-
-    if section_name in type_order:
-        idx = type_order.index(section_name)
+    idx = _TYPE_INDEX.get(section_name)
+    if idx is not None:
+        # Names of existing level-2 sections, collected in one scan
+        existing = set(_LEVEL2_NAME_RE.findall(content))
         # Find the section that should come before this one
-        for i in range(idx - 1, -1, -1):
-            prev_section = type_order[i]
-            if section_exists(content, prev_section):
+        for prev_section in reversed(_TYPE_ORDER[:idx]):
+            if prev_section in existing:
                 # Insert after this section
                 return insert_after_section(content, prev_section, f"\n## {section_name}\n\n{entry}")
 
@@ -307,37 +441,28 @@ def create_section(content: str, section_name: str, entry: str) -> str:
 
 
 def insert_after_section(content: str, section_name: str, text: str) -> str:
-    """Insert text after a specific section."""
-    lines = content.split('\n')
-    result = []
-    in_section = False
-    section_level = 2
-
-    for i, line in enumerate(lines):
-        # Check if this is the section header
-        match = re.match(rf'^(#{2,})\s+{re.escape(section_name)}\s*$', line)
-        if match:
-            in_section = True
-            section_level = len(match.group(1))
-            result.append(line)
-            continue
-
-        # Check if we're leaving the section
-        if in_section:
-            next_section_match = re.match(r'^(#{2,})\s+', line)
-            if next_section_match and len(next_section_match.group(1)) <= section_level:
-                # Insert before this line
-                result.append(text)
-                result.append('')
-                in_section = False
-
-        result.append(line)
-
-    # If still in section at end, append
-    if in_section:
-        result.append(text)
-
-    return '\n'.join(result)
+    """Insert text after a specific section (after every occurrence of it)."""
+    header_re = _section_header_any_level_re(section_name)
+    pieces = []
+    last = 0
+
+    header = header_re.search(content)
+    while header:
+        boundary = _find_section_end(content, header_re, header.end(), len(header.group(1)))
+        if boundary is None:
+            # Still in section at end, append
+            pieces.append(content[last:])
+            pieces.append('\n' + text)
+            return ''.join(pieces)
+
+        # Insert before the next section
+        pieces.append(content[last:boundary])
+        pieces.append(text + '\n\n')
+        last = boundary
+        header = header_re.search(content, boundary)
+
+    pieces.append(content[last:])
+    return ''.join(pieces)
 
 
 def add_to_claude_md(memory: Dict[str, Any], target_path: Path, dry_run: bool = False) -> bool:
@@ -350,18 +475,10 @@ def add_to_claude_md(memory: Dict[str, Any], target_path: Path, dry_run: bool =
         target_path.parent.mkdir(parents=True, exist_ok=True)
         target_path.write_text(f"# CLAUDE.md\n\n")
 
-    content = target_path.read_text()
+    content = _read_claude_md(target_path)
 
     # Determine section based on memory type
-    section_map = {
-        'preference': 'Preferences',
-        'pattern': 'Patterns & Conventions',
-        'workflow': 'Workflows',
-        'project': 'Project-Specific',
-        'correction': 'Learned Corrections',
-        'negative': 'Avoid'
-    }
-    section_name = section_map.get(memory['type'], 'General')
+    section_name = _SECTION_MAP.get(memory['type'], 'General')
 
     # Format memory entry
     memory_entry = format_memory_entry(memory)
@@ -377,16 +494,26 @@ def add_to_claude_md(memory: Dict[str, Any], target_path: Path, dry_run: bool =
         print(memory_entry)
         return True
 
-    target_path.write_text(new_content)
+    # Swap in via temp file + rename (atomic). Rename onto the resolved
+    # path so a symlinked CLAUDE.md stays a link, and keep the file mode.
+    real_path = target_path.resolve()
+    tmp_path = real_path.with_name(real_path.name + ".tmp")
+    tmp_path.write_bytes(new_content.encode("utf-8"))
+    os.chmod(tmp_path, stat.S_IMODE(real_path.stat().st_mode))
+    os.replace(tmp_path, real_path)
+    _claude_md_cache.pop(target_path, None)
     return True
 
 
 def determine_target_claude_md(memory: Dict[str, Any], project_path: Optional[str] = None) -> Path:
     """Determine the correct CLAUDE.md for a memory."""
     scope = memory.get('scope', {})
-    scope_type = scope.get('type', 'global')
-    scope_path = scope.get('path')
+    return _resolve_target(scope.get('type', 'global'), scope.get('path'))
+
 
+@functools.lru_cache(maxsize=128)
+def _resolve_target(scope_type: str, scope_path: Optional[str]) -> Path:
+    """Map a memory scope to its CLAUDE.md; cached so each scope resolves once per run."""
     if scope_type == 'global':
         return GLOBAL_CLAUDE_MD
 
@@ -462,9 +589,7 @@ def present_memory(memory: Dict[str, Any], candidate_num: int, total: int) -> st
 
     # Check for duplicates and overlaps
     if target_path.exists():
-        claude_content = target_path.read_text()
-        dup_status, dup_match = check_duplicate(memory, claude_content)
-        overlaps = check_overlaps(memory, claude_content)
+        dup_status, dup_match, overlaps = analyze_claude_md(memory, get_claude_md_index(target_path))
     else:
         dup_status = 'new'
         dup_match = None
@@ -497,7 +622,7 @@ def present_memory(memory: Dict[str, Any], candidate_num: int, total: int) -> st
     # Show overlaps
     if overlaps:
         print("\nPotential overlaps:")
-        for ov in overlaps[:3]:  # Limit to 3
+        for ov in overlaps:  # Limited to 3 by analyze_claude_md()
             print(f"  - Section '{ov['section_title']}' shares: {', '.join(ov['overlap_keywords'])}")
 
     print("\n" + "-"*70)
@@ -526,12 +651,13 @@ def present_memory(memory: Dict[str, Any], candidate_num: int, total: int) -> st
             print("Invalid choice. Please enter a, d, s, k, or q.")
 
 
+@functools.lru_cache(maxsize=1)
 def get_session_id() -> str:
-    """Get current session ID if available."""
-    session_file = MEMORY_DIR / ".current_session"
-    if session_file.exists():
-        return session_file.read_text().strip()
-    return "unknown"
+    """Get current session ID if available (read once per run)."""
+    try:
+        return (MEMORY_DIR / ".current_session").read_text().strip()
+    except FileNotFoundError:
+        return "unknown"
 
 
 def run_promotion_workflow(
@@ -564,18 +690,25 @@ def run_promotion_workflow(
 
     session_id = get_session_id()
 
-    for i, memory in enumerate(candidates, 1):
+    # Resolve targets and index each distinct CLAUDE.md once up front;
+    # checks in the loop then hit the caches (re-read only if a file changes)
+    targets = [determine_target_claude_md(memory) for memory in candidates]
+    for path in dict.fromkeys(targets):
+        if path.exists():
+            get_claude_md_index(path)
+
+    for i, (memory, target_path) in enumerate(zip(candidates, targets), 1):
         memory_id = memory['id']
         scope_info = memory.get('scope', {})
         scope_type = scope_info.get('type', 'global')
-        target_path = determine_target_claude_md(memory)
 
         if auto:
             # Auto mode: only add if no duplicates/overlaps
             if target_path.exists():
-                claude_content = target_path.read_text()
-                dup_status, _ = check_duplicate(memory, claude_content)
-                overlaps = check_overlaps(memory, claude_content)
+                # Only whether any overlap exists matters here
+                dup_status, _, overlaps = analyze_claude_md(
+                    memory, get_claude_md_index(target_path), overlap_limit=1
+                )
 
                 if dup_status != 'new' or overlaps:
                     print(f"[{i}/{len(candidates)}] Skipping '{memory['content']['title']}' - duplicates/overlaps detected")
@@ -682,21 +815,26 @@ def list_candidates(scope: str = "all", project_path: Optional[str] = None):
         scope_info = memory.get('scope', {})
         target_path = determine_target_claude_md(memory)
 
-        print(f"{i}. {content.get('title', 'Untitled')}")
-        print(f"   Description: {content.get('description', '')}")
-        print(f"   Confidence: {meta.get('confidence', 0):.2f}")
-        print(f"   Scope: {scope_info.get('type', 'global')}")
-        print(f"   Target: {target_path}")
+        # One write per candidate instead of a print per line
+        lines = [
+            f"{i}. {content.get('title', 'Untitled')}",
+            f"   Description: {content.get('description', '')}",
+            f"   Confidence: {meta.get('confidence', 0):.2f}",
+            f"   Scope: {scope_info.get('type', 'global')}",
+            f"   Target: {target_path}",
+        ]
 
         # Check for duplicates
         if target_path.exists():
-            dup_status, dup_match = check_duplicate(memory, target_path.read_text())
+            dup_status, dup_match = check_duplicate(memory, get_claude_md_index(target_path))
             if dup_status == 'exact':
-                print(f"   WARNING: Exact duplicate of '{dup_match}'")
+                lines.append(f"   WARNING: Exact duplicate of '{dup_match}'")
             elif dup_status == 'similar':
-                print(f"   Note: Similar to '{dup_match}'")
+                lines.append(f"   Note: Similar to '{dup_match}'")
+
+        sys.stdout.write('\n'.join(lines) + '\n\n')
 
-        print()
+    sys.stdout.flush()
 
 
 def show_decisions(limit: int = 20):
@@ -709,9 +847,8 @@ def show_decisions(limit: int = 20):
         print("ccmem: No promotion decisions recorded.")
         return
 
-    # Show most recent first
-    decisions.reverse()
-    decisions = decisions[:limit]
+    # Show most recent first (only the tail is needed)
+    decisions = decisions[-limit:][::-1]
 
     print(f"ccmem: Last {len(decisions)} promotion decision(s):\n")
 
@@ -726,14 +863,19 @@ def show_decisions(limit: int = 20):
 
         decision_icon = {'added': '+', 'denied': '-', 'kept_observing': '~'}.get(decision, '?')
 
-        print(f"{ts} [{decision_icon}] {memory_name}")
-        print(f"    Decision: {decision}")
+        # One write per decision instead of a print per line
+        lines = [
+            f"{ts} [{decision_icon}] {memory_name}",
+            f"    Decision: {decision}",
+        ]
         if d.get('developed'):
-            print(f"    Note: Memory was refined before adding")
-        print(f"    Target: {target}")
+            lines.append("    Note: Memory was refined before adding")
+        lines.append(f"    Target: {target}")
         if d.get('reason'):
-            print(f"    Reason: {d['reason']}")
-        print()
+            lines.append(f"    Reason: {d['reason']}")
+        sys.stdout.write('\n'.join(lines) + '\n\n')
+
+    sys.stdout.flush()
 
 
 def main():
@@ -13,32 +13,75 @@ Usage:
 """
 
 import argparse
+import functools
 import json
+import mmap
 import os
 import re
+import stat
 import sys
-from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 # Add lib directory to path
 sys.path.insert(0, str(Path(__file__).parent / "lib"))
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from memory_lib import (
     MEMORY_DIR,
     load_config,
     load_index,
     load_memory,
     create_memory,
-    list_memories,
     get_project_hash,
-    format_memory_for_display
+    format_memory_for_display,
+    INDEX_FILE,
+    SEARCH_INDEX_FILE
 )
 
 # Constants
 GLOBAL_CLAUDE_MD = Path.home() / ".claude" / "CLAUDE.md"
 AUTO_PROMOTE_THRESHOLD = 0.8
 MIN_POSITIVE_RATIO = 0.7
+PARALLEL_LOAD_MIN = 8  # Load serially at or below this many memories
+MMAP_MIN_SIZE = 64 * 1024  # Memory-map CLAUDE.md files larger than this
+
+# Memory types in CLAUDE.md section order, with their section titles
+TYPE_ORDER = ["preference", "pattern", "workflow", "project", "correction", "negative"]
+TYPE_TITLES = {
+    "preference": "Preferences",
+    "pattern": "Patterns & Conventions",
+    "workflow": "Workflows",
+    "project": "Project-Specific",
+    "correction": "Learned Corrections",
+    "negative": "Avoid"
+}
+
+# Parsed CLAUDE.md files: path -> ((mtime_ns, size), parse result)
+_PARSE_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# Precompiled patterns
+_SYNC_START_RE = re.compile(r'<!--\s*memory-sync:\s*start\s*-->')
+_SYNC_END_RE = re.compile(r'<!--\s*memory-sync:\s*end\s*-->')
+_MEM_RE = re.compile(r'<!--\s*source:\s*(\S+),\s*confidence:\s*([\d.]+)\s*-->')
+_RULE_RE = re.compile(r'^[\s]*[-*][\s]+(.+)$', re.MULTILINE)
+_WORD_RE = re.compile(r'\b\w{4,}\b')
+
+# Rule classification keywords, in priority order (first hit wins)
+_CLS_KEYWORDS = (
+    ("preference", ("prefer", "always use", "never use")),
+    ("pattern", ("pattern", "convention", "style")),
+    ("workflow", ("before", "after", "workflow", "process")),
+    ("negative", ("never", "avoid", "don't")),
+)
 
 
 def find_claude_md(project_path: Optional[str] = None) -> Optional[Path]:
@@ -49,33 +92,58 @@ def find_claude_md(project_path: Optional[str] = None) -> Optional[Path]:
     1. If project_path provided: {project}/CLAUDE.md or {project}/.claude/CLAUDE.md
     2. Walk up from current directory
     3. Global ~/.claude/CLAUDE.md
+
+    Results are cached per (project_path, cwd) for the duration of the run.
     """
+    found = _find_claude_md_cached(project_path, str(Path.cwd()))
+    return Path(found) if found else None
+
+
+@functools.lru_cache(maxsize=32)
+def _find_claude_md_cached(project_path: Optional[str], cwd: str) -> Optional[str]:
+    """Uncached lookup behind find_claude_md(); returns a str path or None."""
     # Check project path first
     if project_path:
-        project = Path(project_path).resolve()
-        candidates = [
-            project / ".claude" / "CLAUDE.md",
-            project / "CLAUDE.md"
-        ]
-        for candidate in candidates:
-            if candidate.exists():
-                return candidate
+        found = _claude_md_in_dir(Path(project_path).resolve())
+        if found:
+            return found
 
     # Walk up from current directory
-    cwd = Path.cwd().resolve()
+    cwd = Path(cwd).resolve()
     while cwd != cwd.parent:
-        candidates = [
-            cwd / ".claude" / "CLAUDE.md",
-            cwd / "CLAUDE.md"
-        ]
-        for candidate in candidates:
-            if candidate.exists():
-                return candidate
+        found = _claude_md_in_dir(cwd)
+        if found:
+            return found
         cwd = cwd.parent
 
     # Fall back to global
     if GLOBAL_CLAUDE_MD.exists():
-        return GLOBAL_CLAUDE_MD
+        return str(GLOBAL_CLAUDE_MD)
+
+    return None
+
+
+def _claude_md_in_dir(directory: Path) -> Optional[str]:
+    """
+    Return {directory}/.claude/CLAUDE.md or {directory}/CLAUDE.md if present.
+
+    Lists the directory once instead of stat-ing each candidate; the
+    .claude/ subdirectory is only checked when it exists.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = {e.name: e for e in it if e.name in (".claude", "CLAUDE.md")}
+    except (PermissionError, FileNotFoundError, NotADirectoryError):
+        return None
+
+    claude_dir = entries.get(".claude")
+    if claude_dir is not None and claude_dir.is_dir():
+        candidate = Path(claude_dir.path) / "CLAUDE.md"
+        if candidate.exists():
+            return str(candidate)
+
+    if "CLAUDE.md" in entries:
+        return entries["CLAUDE.md"].path
 
     return None
 
@@ -99,68 +167,201 @@ def get_claude_md_for_scope(scope_type: str, project_path: Optional[str] = None)
     return GLOBAL_CLAUDE_MD
 
 
+def _read_claude_md_text(claude_md_path: Path) -> str:
+    """
+    Read a CLAUDE.md file as text.
+
+    Large files are decoded straight from a memory map, skipping the
+    intermediate bytes copy that read_text() makes. Newlines are normalized
+    the same way text mode would.
+    """
+    if claude_md_path.stat().st_size <= MMAP_MIN_SIZE:
+        return claude_md_path.read_text()
+
+    with open(claude_md_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            content = str(mm, "utf-8")
+
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _iter_sync_blocks(content: str):
+    """
+    Yield (start, end, inner) for each memory-sync block in content.
+
+    Start and end markers are located separately, so an unterminated start
+    marker ends the scan instead of re-scanning to end of file (linear time).
+    """
+    pos = 0
+    while True:
+        start = _SYNC_START_RE.search(content, pos)
+        if not start:
+            return
+        end = _SYNC_END_RE.search(content, start.end())
+        if not end:
+            return
+        yield start.start(), end.end(), content[start.end():end.start()]
+        pos = end.end()
+
+
 def parse_claude_md(claude_md_path: Path) -> Dict[str, Any]:
     """
     Parse a CLAUDE.md file for structured content.
 
     Returns dict with:
     - manual_sections: Content outside memory-sync blocks
-    - auto_synced: List of auto-synced memory sections
+    - auto_synced: List of auto-synced memory references (memory_id, confidence)
     - all_content: Raw content
     """
     if not claude_md_path.exists():
         return {"manual_sections": "", "auto_synced": [], "all_content": ""}
 
-    content = claude_md_path.read_text()
-
-    # Find auto-synced sections
-    auto_sync_pattern = r'<!--\s*memory-sync:\s*start\s*-->(.*?)<!--\s*memory-sync:\s*end\s*-->'
-    auto_sync_matches = re.findall(auto_sync_pattern, content, re.DOTALL)
-
-    # Extract manual sections (outside sync blocks)
-    manual_content = re.sub(auto_sync_pattern, '', content, flags=re.DOTALL)
+    # Reuse the previous parse if the file hasn't changed since
+    st = claude_md_path.stat()
+    cache_key = str(claude_md_path)
+    cached = _PARSE_CACHE.get(cache_key)
+    if cached and cached[0] == (st.st_mtime_ns, st.st_size):
+        return cached[1]
+
+    content = _read_claude_md_text(claude_md_path)
+
+    # Find auto-synced sections and collect manual content (outside sync
+    # blocks) in the same pass
+    auto_sync_matches = []
+    pieces = []
+    last = 0
+    for start, end, section in _iter_sync_blocks(content):
+        pieces.append(content[last:start])
+        auto_sync_matches.append(section)
+        last = end
+    pieces.append(content[last:])
+    manual_content = ''.join(pieces)
 
     # Parse individual memory entries from auto-synced sections
     auto_synced = []
     for section in auto_sync_matches:
         # Look for memory references: <!-- source: memory_id, confidence: X.XX -->
-        mem_pattern = r'<!--\s*source:\s*(\S+),\s*confidence:\s*([\d.]+)\s*-->'
-        for match in re.finditer(mem_pattern, section):
+        for match in _MEM_RE.finditer(section):
             auto_synced.append({
                 "memory_id": match.group(1),
-                "confidence": float(match.group(2)),
-                "section": section[match.start():match.end() + 500]  # Context after
+                "confidence": float(match.group(2))
             })
 
-    return {
+    result = {
         "manual_sections": manual_content.strip(),
         "auto_synced": auto_synced,
         "all_content": content
     }
+    _PARSE_CACHE[cache_key] = ((st.st_mtime_ns, st.st_size), result)
+    return result
 
 
-def format_memory_for_claude_md(memory: Dict[str, Any]) -> str:
-    """Format a single memory as a CLAUDE.md section."""
+def _emit_memory_lines(memory: Dict[str, Any], out: List[str]) -> None:
+    """Append the CLAUDE.md lines for a single memory onto `out`."""
     content = memory["content"]
     meta = memory["metadata"]
     memory_id = memory["id"]
     confidence = meta.get("confidence", 0)
 
-    lines = [
-        f"<!-- source: {memory_id}, confidence: {confidence:.2f} -->",
-        f"- **{content['title']}**",
-        f"  - {content['description']}",
-    ]
+    out.append(f"<!-- source: {memory_id}, confidence: {confidence:.2f} -->")
+    out.append(f"- **{content['title']}**")
+    out.append(f"  - {content['description']}")
 
     if content.get("action"):
-        lines.append(f"  - {content['action']}")
+        out.append(f"  - {content['action']}")
 
     if content.get("examples"):
         for example in content["examples"][:3]:  # Limit to 3 examples
-            lines.append(f"  - Example: `{example}`")
+            out.append(f"  - Example: `{example}`")
+
+    out.append("")  # Empty line after
 
-    lines.append("")  # Empty line after
-    return "\n".join(lines)
+
+def meets_promotion_criteria(record: Dict[str, Any]) -> bool:
+    """
+    Check a memory's metadata against the positive ratio and status criteria.
+    """
+    positive, negative, status = (
+        record.get("positive_reinforcement", 0),
+        record.get("negative_reinforcement", 0),
+        record.get("status")
+    )
+
+    if status != "active":
+        return False
+
+    total = positive + negative
+    if total == 0:
+        positive_ratio = 0.5  # Neutral if no feedback
+    else:
+        positive_ratio = positive / total
+
+    return positive_ratio >= MIN_POSITIVE_RATIO
+
+
+def load_promotion_candidates() -> Optional[List[Dict[str, Any]]]:
+    """
+    Load the confidence-sorted promotion candidates from the search index.
+
+    Returns None if the search index is missing, predates the candidate list,
+    or is older than index.json (confidence may have changed since).
+    """
+    try:
+        if SEARCH_INDEX_FILE.stat().st_mtime < INDEX_FILE.stat().st_mtime:
+            return None
+        return _json_loads(SEARCH_INDEX_FILE.read_bytes()).get("promotion_candidates")
+    except (OSError, ValueError):  # orjson.JSONDecodeError subclasses ValueError
+        return None
+
+
+def iter_promotable_memories(scope_type: str, project_hash: Optional[str] = None):
+    """
+    Yield memories that meet all promotion criteria.
+
+    Confidence is checked against the raw index entries first, so memories
+    below the threshold are never loaded from disk. Positive ratio and
+    status are checked after loading: the index copies of those fields are
+    not kept current by every writer.
+
+    Uses the confidence-sorted candidate list from the search index when it
+    is current, so the scan stops at the first entry below the threshold.
+    """
+    candidates = load_promotion_candidates()
+
+    if candidates is not None:
+        entries = []
+        for row in candidates:
+            if row["confidence"] < AUTO_PROMOTE_THRESHOLD:
+                break
+            if scope_type == "global" or row["project_hash"] == project_hash:
+                entries.append(row)
+        entries.sort(key=lambda row: row["position"])  # Keep index order
+    else:
+        index = load_index()
+        projects = index["memories"]["projects"]
+
+        if scope_type == "global":
+            entries = list(index["memories"]["global"])
+            for project in projects.values():
+                entries.extend(project.get("memories", []))
+        else:
+            entries = projects.get(project_hash, {}).get("memories", [])
+
+    memory_ids = [entry["id"] for entry in entries
+                  if entry.get("confidence", 0) >= AUTO_PROMOTE_THRESHOLD]
+
+    # Loading is dominated by small-file I/O, so overlap it across threads
+    if len(memory_ids) > PARALLEL_LOAD_MIN:
+        with ThreadPoolExecutor(max_workers=min(32, len(memory_ids))) as executor:
+            memories = list(executor.map(load_memory, memory_ids))
+    else:
+        memories = [load_memory(memory_id) for memory_id in memory_ids]
+
+    for memory in memories:
+        if memory and meets_promotion_criteria(memory["metadata"]):
+            yield memory
 
 
 def promote_memories_to_claude_md(
@@ -185,28 +386,8 @@ def promote_memories_to_claude_md(
         scope_type = "global"
         project_hash = None
 
-    # Get memories to promote
-    memories = list_memories(
-        scope="all" if scope_type == "global" else "project",
-        project_hash=project_hash,
-        min_confidence=AUTO_PROMOTE_THRESHOLD
-    )
-
-    # Filter by positive ratio and status
-    promoted = []
-    for memory in memories:
-        meta = memory["metadata"]
-        positive = meta.get("positive_reinforcement", 0)
-        negative = meta.get("negative_reinforcement", 0)
-        total = positive + negative
-
-        if total == 0:
-            positive_ratio = 0.5  # Neutral if no feedback
-        else:
-            positive_ratio = positive / total
-
-        if positive_ratio >= MIN_POSITIVE_RATIO and meta.get("status") == "active":
-            promoted.append(memory)
+    # Get memories to promote (filtered by confidence, positive ratio and status)
+    promoted = list(iter_promotable_memories(scope_type, project_hash))
 
     if not promoted:
         print(f"No memories meet promotion criteria for {scope_type} scope")
@@ -226,30 +407,17 @@ def promote_memories_to_claude_md(
     auto_sync_content.append("")
 
     # Group memories by type
-    by_type: Dict[str, List[Dict]] = {}
+    by_type: Dict[str, List[Dict]] = defaultdict(list)
     for memory in promoted:
-        mem_type = memory.get("type", "general")
-        if mem_type not in by_type:
-            by_type[mem_type] = []
-        by_type[mem_type].append(memory)
+        by_type[memory.get("type", "general")].append(memory)
 
     # Format each group
-    type_order = ["preference", "pattern", "workflow", "project", "correction", "negative"]
-    type_titles = {
-        "preference": "Preferences",
-        "pattern": "Patterns & Conventions",
-        "workflow": "Workflows",
-        "project": "Project-Specific",
-        "correction": "Learned Corrections",
-        "negative": "Avoid"
-    }
-
-    for mem_type in type_order:
+    for mem_type in TYPE_ORDER:
         if mem_type in by_type:
-            auto_sync_content.append(f"### {type_titles.get(mem_type, mem_type.title())}")
+            auto_sync_content.append(f"### {TYPE_TITLES[mem_type]}")
             auto_sync_content.append("")
             for memory in by_type[mem_type]:
-                auto_sync_content.append(format_memory_for_claude_md(memory))
+                _emit_memory_lines(memory, auto_sync_content)
             auto_sync_content.append("")
 
     auto_sync_content.append("<!-- memory-sync: end -->")
@@ -271,7 +439,14 @@ def promote_memories_to_claude_md(
     # Write if not dry run
     if not dry_run:
         claude_md_path.parent.mkdir(parents=True, exist_ok=True)
-        claude_md_path.write_text("\n".join(new_content))
+        # Replace atomically through any symlink (e.g. a CLAUDE.md kept in
+        # dotfiles), keeping the existing file's mode
+        real_path = claude_md_path.resolve()
+        tmp_path = real_path.with_name(real_path.name + ".tmp")
+        tmp_path.write_bytes("\n".join(new_content).encode("utf-8"))
+        if real_path.exists():
+            os.chmod(tmp_path, stat.S_IMODE(real_path.stat().st_mode))
+        os.replace(tmp_path, real_path)
         print(f"Updated {claude_md_path} with {len(promoted)} memories")
     else:
         print(f"Would update {claude_md_path} with {len(promoted)} memories")
@@ -281,6 +456,33 @@ def promote_memories_to_claude_md(
     return [m["id"] for m in promoted]
 
 
+def classify_rule(rule_lower: str) -> str:
+    """
+    Pick a memory type for a lowercased rule from its keywords.
+
+    Plain substring checks run on CPython's C fast-search and stop at the
+    first hit, which beats a regex scan over every keyword.
+    """
+    for mem_type, keywords in _CLS_KEYWORDS:
+        for keyword in keywords:
+            if keyword in rule_lower:
+                return mem_type
+    return "project"
+
+
+def _first_n_unique(items, n: int) -> List[str]:
+    """Return the first n distinct items, in order, without consuming the rest."""
+    seen = set()
+    out = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            out.append(item)
+            if len(out) == n:
+                break
+    return out
+
+
 def import_claude_md_to_memories(
     project_path: Optional[str] = None,
     dry_run: bool = False
@@ -307,11 +509,13 @@ def import_claude_md_to_memories(
     manual = parsed["manual_sections"]
 
     # Pattern: lines starting with - or * that look like rules
-    rule_pattern = r'^[\s]*[-*][\s]+(.+)$'
-    potential_rules = re.findall(rule_pattern, manual, re.MULTILINE)
+    potential_rules = _RULE_RE.findall(manual)
 
     created_memories = []
 
+    # All evidence from this import shares the run's timestamp
+    now_iso = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
     for rule in potential_rules:
         # Skip short or obvious non-rules
         if len(rule) < 10:
@@ -319,20 +523,12 @@ def import_claude_md_to_memories(
 
         # Determine type based on keywords
         rule_lower = rule.lower()
-        if any(w in rule_lower for w in ["prefer", "always use", "never use"]):
-            mem_type = "preference"
-        elif any(w in rule_lower for w in ["pattern", "convention", "style"]):
-            mem_type = "pattern"
-        elif any(w in rule_lower for w in ["before", "after", "workflow", "process"]):
-            mem_type = "workflow"
-        elif any(w in rule_lower for w in ["never", "avoid", "don't"]):
-            mem_type = "negative"
-        else:
-            mem_type = "project"
+        mem_type = classify_rule(rule_lower)
 
         # Extract keywords for triggers
-        words = re.findall(r'\b\w{4,}\b', rule_lower)
-        keywords = list(set(words))[:5]  # Top 5 unique words
+        keywords = _first_n_unique(
+            (m.group() for m in _WORD_RE.finditer(rule_lower)), 5
+        )  # First 5 unique words
 
         if not dry_run:
             memory_id = create_memory(
@@ -350,7 +546,7 @@ def import_claude_md_to_memories(
                 },
                 tags=["from-claude-md", mem_type],
                 evidence=[{
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
+                    "timestamp": now_iso,
                     "description": f"Imported from {claude_md_path}",
                     "source": "claude-md-import"
                 }],
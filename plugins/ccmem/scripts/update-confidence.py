@@ -6,21 +6,238 @@ Adjusts memory confidence based on feedback and applies time-based decay.
 """
 
 import sys
+import functools
 import json
+import mmap
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
+# Memory files are only read back by scripts, so they are written compact
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent / "lib"))
 from memory_lib import (
     load_config, save_config,
     load_index, save_index,
-    load_memory, get_memory_path, get_project_hash,
+    load_memory, get_memory_path, get_project_hash, create_correction_memory,
     GLOBAL_MEMORIES_DIR, PROJECTS_DIR, FEEDBACK_FILE
 )
 
+# Memories of a project share its path; hash each path once per run
+get_project_hash = functools.lru_cache(maxsize=1024)(get_project_hash)
+
+PARALLEL_IO_MIN = 8  # Read/write memory files serially at or below this many
+
+# Minimum time between decay runs. Daily schedules (cron, launchd) start
+# about 24h apart, sometimes a little under, so the gate leaves slack
+DECAY_MIN_INTERVAL = timedelta(hours=20)
+
+# 0.99 ^ days for the usual range of days since access
+DECAY_TABLE = tuple(0.99 ** days for days in range(4096))
+
+# Byte offset just past the last processed feedback line (older versions
+# stored the last processed timestamp instead)
+FEEDBACK_MARKER = Path(__file__).parent.parent / ".feedback_processed"
+
+# Timestamp of a feedback line, read without parsing the rest of the entry
+_TIMESTAMP_RE = re.compile(rb'"timestamp"\s*:\s*"([^"]*)"')
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp ("...Z") into a naive UTC datetime."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).replace(tzinfo=None)
+
+
+def _clamp(value: float, lo: float = 0.1, hi: float = 1.0) -> float:
+    """Clamp a confidence to [lo, hi] without min()/max() calls."""
+    return lo if value < lo else hi if value > hi else value
+
+
+def _days_since_access(record: dict, now: datetime, now_epoch: int):
+    """
+    Whole days since a memory's metadata or index entry was last accessed.
+
+    Uses last_accessed_epoch while it still belongs to last_accessed
+    (last_accessed_epoch_of holds the timestamp it was taken from; other
+    writers update last_accessed alone) and parses the ISO timestamp
+    otherwise. Returns None if the record has no access or creation time.
+    """
+    epoch = record.get("last_accessed_epoch")
+    if epoch is not None and record.get("last_accessed_epoch_of") == record.get("last_accessed"):
+        return (now_epoch - epoch) // 86400
+
+    last_accessed_str = record.get("last_accessed") or record.get("created_at")
+    if last_accessed_str:
+        return (now - _parse_timestamp(last_accessed_str)).days
+    return None
+
+
+def _map_io(func, items: list) -> list:
+    """Apply an I/O-bound func to items (in order), using threads for larger batches."""
+    if len(items) > PARALLEL_IO_MIN:
+        with ThreadPoolExecutor(max_workers=min(16, len(items))) as executor:
+            return list(executor.map(func, items))
+    return [func(item) for item in items]
+
+
+def _write_memory(memory_path: Path, memory: dict) -> None:
+    """Write a memory file atomically (temp file + rename)."""
+    tmp_path = memory_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(_json_dumps(memory))
+    os.replace(tmp_path, memory_path)
+
+
+def _memory_path(memory_id: str, memory: dict) -> Path:
+    """Path of a loaded memory's file, from its scope."""
+    project_path = memory.get("scope", {}).get("path")
+    project_hash = get_project_hash(project_path) if project_path else None
+    return get_memory_path(memory_id, project_hash)
+
+
+def _flush_memories(dirty: dict) -> None:
+    """Write queued memories (memory ID -> memory) and empty the queue."""
+    pairs = [(_memory_path(memory_id, memory), memory) for memory_id, memory in dirty.items()]
+    _map_io(lambda pair: _write_memory(*pair), pairs)
+    dirty.clear()
+
+
+def _decayed_confidence(confidence: float, days_since_access: int, positive: int,
+                        total: int, min_confidence: float) -> float:
+    """Confidence after decaying for days_since_access, floored at min_confidence."""
+    # Exponential decay: confidence *= 0.99 ^ days
+    if 0 <= days_since_access < len(DECAY_TABLE):
+        decay_factor = DECAY_TABLE[days_since_access]
+    else:
+        decay_factor = 0.99 ** days_since_access
+
+    # Memories with positive feedback decay slower
+    if total > 0:
+        positive_ratio = positive / total
+        # Scale decay factor: high positive_ratio = slower decay
+        decay_factor = decay_factor * (0.5 + 0.5 * positive_ratio)
+
+    # Apply minimum confidence floor
+    confidence *= decay_factor
+    return confidence if confidence > min_confidence else min_confidence
+
+
+# Index entry fields that mirror every input of the decay calculation
+_DECAY_FIELDS = ("confidence", "last_accessed", "access_count", "positive_reinforcement", "status")
+
 
-def adjust_confidence(memory_id: str, outcome: str, confidence_delta: float = 0.0) -> bool:
+def _unchanged_by_decay(entry: dict, now: datetime, now_epoch: int, min_confidence: float) -> bool:
+    """
+    Check from the index entry alone that decay would leave a memory unchanged.
+
+    False when the entry lacks any of the decay inputs (older indexes), in
+    which case the memory file has to be loaded to decide.
+    """
+    if any(entry.get(field) is None for field in _DECAY_FIELDS):
+        return False
+
+    if entry["status"] in ("archived", "superseded"):
+        return True
+
+    days_since_access = _days_since_access(entry, now, now_epoch)
+    if days_since_access < 1:
+        return True
+
+    new_confidence = _decayed_confidence(entry["confidence"], days_since_access,
+                                         entry["positive_reinforcement"], entry["access_count"],
+                                         min_confidence)
+    return abs(new_confidence - entry["confidence"]) <= 0.001
+
+
+def _record_decay_run(timestamp: str) -> None:
+    """
+    Set last_decay_run in config.json.
+
+    Re-reads the file first: the session hooks rewrite config.json while
+    maintenance may be running, and their changes must not be lost.
+    """
+    config = load_config()
+    config["last_decay_run"] = timestamp
+    save_config(config)
+
+
+def _first_line_after(mm, start: int, end: int, timestamp: str) -> int:
+    """
+    Find the first line in mm[start:end] stamped later than timestamp.
+
+    feedback.jsonl is append-only, so its timestamps are in order and the
+    cut-off can be bisected by byte position; only the probed lines have
+    their timestamp read. A probe on a line without one (a comment, a
+    blank line) moves on to the next stamped line.
+    Returns the byte offset of that line (end if there is none).
+    """
+    cutoff = timestamp.encode("utf-8")
+    lo, hi = start, end
+
+    while lo < hi:
+        mid = (lo + hi) // 2
+        probe_start = mm.rfind(b"\n", lo, mid) + 1 or lo
+
+        line_start = probe_start
+        match = None
+        while match is None and line_start < hi:
+            line_end = mm.find(b"\n", line_start, end) + 1 or end
+            match = _TIMESTAMP_RE.search(mm, line_start, line_end)
+            if match is None:
+                line_start = line_end
+
+        if match is not None and match.group(1) <= cutoff:
+            lo = line_end
+        else:
+            hi = probe_start
+
+    return lo
+
+
+def _build_id_lookup(index: dict) -> dict:
+    """Map memory ID -> index entry (global first, then projects; first match wins)."""
+    lookup = {}
+    for entry in index["memories"]["global"]:
+        lookup.setdefault(entry["id"], entry)
+    for project in index["memories"]["projects"].values():
+        for entry in project.get("memories", []):
+            lookup.setdefault(entry["id"], entry)
+    return lookup
+
+
+def _find_index_entry(index: dict, memory_id: str, project_hash: str = None):
+    """
+    Find a memory's index entry without a prebuilt lookup.
+
+    Searches the list the memory's scope points to (its project, or global)
+    and only falls back to every list if the entry isn't there.
+    """
+    if project_hash:
+        entries = index["memories"]["projects"].get(project_hash, {}).get("memories", [])
+    else:
+        entries = index["memories"]["global"]
+
+    for entry in entries:
+        if entry["id"] == memory_id:
+            return entry
+
+    return _build_id_lookup(index).get(memory_id)
+
+
+def adjust_confidence(memory_id: str, outcome: str, confidence_delta: float = 0.0,
+                      *, index: dict = None, lookup: dict = None, dirty: dict = None) -> bool:
     """
     Adjust memory confidence based on feedback outcome.
 
@@ -28,11 +245,20 @@ def adjust_confidence(memory_id: str, outcome: str, confidence_delta: float = 0.
         memory_id: ID of memory to update
         outcome: "accepted", "rejected", or "superseded"
         confidence_delta: Additional explicit adjustment
+        index: Loaded index to update in place; the caller saves it.
+            Loaded and saved here when omitted.
+        lookup: _build_id_lookup() of index, reused across calls; without
+            one the entry is found via the memory's scope
+        dirty: Queue of changed memories (memory ID -> memory) for the caller
+            to write with _flush_memories(); the memory is read from and
+            left in it instead of being written here
 
     Returns:
         True if updated successfully
     """
-    memory = load_memory(memory_id)
+    memory = dirty.get(memory_id) if dirty is not None else None
+    if memory is None:
+        memory = load_memory(memory_id)
     if not memory:
         print(f"Memory not found: {memory_id}")
         return False
@@ -41,13 +267,13 @@ def adjust_confidence(memory_id: str, outcome: str, confidence_delta: float = 0.
 
     if outcome == "accepted":
         # Positive feedback - boost confidence
-        meta["confidence"] = min(1.0, meta["confidence"] + 0.1)
+        meta["confidence"] = _clamp(meta["confidence"] + 0.1)
         meta["positive_reinforcement"] = meta.get("positive_reinforcement", 0) + 1
         print(f"  + Reinforced: confidence -> {meta['confidence']:.2f}")
 
     elif outcome == "rejected":
         # Negative feedback - significant confidence drop
-        meta["confidence"] = max(0.1, meta["confidence"] - 0.2)
+        meta["confidence"] = _clamp(meta["confidence"] - 0.2)
         meta["negative_reinforcement"] = meta.get("negative_reinforcement", 0) + 1
         print(f"  - Rejected: confidence -> {meta['confidence']:.2f}")
 
@@ -63,63 +289,76 @@ def adjust_confidence(memory_id: str, outcome: str, confidence_delta: float = 0.
 
     # Apply explicit confidence delta
     if confidence_delta:
-        meta["confidence"] = min(1.0, max(0.1, meta["confidence"] + confidence_delta))
+        meta["confidence"] = _clamp(meta["confidence"] + confidence_delta)
         print(f"  ~ Delta applied: confidence -> {meta['confidence']:.2f}")
 
     # Update access tracking
     meta["last_accessed"] = datetime.utcnow().isoformat() + "Z"
+    meta["last_accessed_epoch"] = int(time.time())  # Saves decay parsing the timestamp
+    meta["last_accessed_epoch_of"] = meta["last_accessed"]
     meta["access_count"] = meta.get("access_count", 0) + 1
 
     # Save updated memory
     project_path = memory.get("scope", {}).get("path")
     project_hash = get_project_hash(project_path) if project_path else None
-    memory_path = get_memory_path(memory_id, project_hash)
 
-    with open(memory_path, 'w') as f:
-        json.dump(memory, f, indent=2)
+    if dirty is not None:
+        dirty[memory_id] = memory
+    else:
+        _write_memory(get_memory_path(memory_id, project_hash), memory)
 
     # Update index
-    index = load_index()
-    updated = False
-
-    for entry in index["memories"]["global"]:
-        if entry["id"] == memory_id:
-            entry["confidence"] = meta["confidence"]
-            entry["last_accessed"] = meta["last_accessed"]
-            entry["access_count"] = meta["access_count"]
-            updated = True
-            break
-
-    if not updated:
-        for project in index["memories"]["projects"].values():
-            for entry in project.get("memories", []):
-                if entry["id"] == memory_id:
-                    entry["confidence"] = meta["confidence"]
-                    entry["last_accessed"] = meta["last_accessed"]
-                    entry["access_count"] = meta["access_count"]
-                    updated = True
-                    break
-            if updated:
-                break
-
-    save_index(index)
+    own_index = index is None
+    if own_index:
+        index = load_index()
+    if lookup is not None:
+        entry = lookup.get(memory_id)
+    else:
+        entry = _find_index_entry(index, memory_id, project_hash)
+    if entry is not None:
+        entry["confidence"] = meta["confidence"]
+        entry["last_accessed"] = meta["last_accessed"]
+        entry["last_accessed_epoch"] = meta["last_accessed_epoch"]
+        entry["last_accessed_epoch_of"] = meta["last_accessed_epoch_of"]
+        entry["access_count"] = meta["access_count"]
+        entry["positive_reinforcement"] = meta.get("positive_reinforcement", 0)
+        entry["negative_reinforcement"] = meta.get("negative_reinforcement", 0)
+        entry["status"] = meta.get("status", "active")
+
+    if own_index:
+        save_index(index)
     return True
 
 
-def apply_confidence_decay(dry_run: bool = False) -> dict:
+def apply_confidence_decay(dry_run: bool = False, *, index: dict = None,
+                           dirty: dict = None, config: dict = None) -> dict:
     """
     Apply time-based confidence decay to all memories.
 
     Memories lose confidence over time if not accessed or reinforced.
-    Positive feedback slows decay.
+    Positive feedback slows decay. Runs at most once a day (at least
+    DECAY_MIN_INTERVAL apart): the last run is recorded in config, and
+    memories an interrupted run decayed within that interval are skipped.
+    Dry runs ignore both limits and preview a full decay pass.
 
     Args:
-        dry_run: If True, show what would happen without making changes
+        dry_run: If True, show what a decay pass would change without
+            making changes, regardless of when decay last ran
+        index: Loaded index to update in place; the caller saves it.
+            Loaded (and saved if anything decayed) here when omitted.
+        dirty: Queue of changed memories (memory ID -> memory); queued
+            memories are decayed from the queue and decayed ones are added
+            for the caller to write. Written here when omitted.
+        config: Loaded config; the run is recorded in it and the caller
+            saves it with _record_decay_run() once the queued memories are
+            written. Loaded (and the run recorded) here when omitted.
 
     Returns:
         Statistics about the decay operation
     """
-    config = load_config()
+    own_config = config is None
+    if own_config:
+        config = load_config()
     decay_days = config["settings"].get("confidence_decay_days", 30)
     min_confidence = config["settings"].get("min_confidence", 0.1)
 
@@ -130,10 +369,24 @@ def apply_confidence_decay(dry_run: bool = False) -> dict:
         "unchanged": 0
     }
 
-    index = load_index()
+    now = datetime.utcnow()
+    now_epoch = int(time.time())
+    now_iso = now.isoformat() + "Z"
+    last_run = config.get("last_decay_run")
+    if not dry_run and last_run and now - _parse_timestamp(last_run) < DECAY_MIN_INTERVAL:
+        print(f"Decay already applied recently (last run: {last_run})")
+        return stats
 
-    def process_memory(memory_id: str, entry: dict) -> None:
-        memory = load_memory(memory_id)
+    own_index = index is None
+    if own_index:
+        index = load_index()
+
+    # Decayed memories, written together after the sweep
+    own_dirty = dirty is None
+    if own_dirty:
+        dirty = {}
+
+    def process_memory(memory_id: str, entry: dict, memory: dict) -> None:
         if not memory:
             return
 
@@ -145,43 +398,32 @@ def apply_confidence_decay(dry_run: bool = False) -> dict:
             stats["unchanged"] += 1
             return
 
+        # Skip memories an interrupted run already decayed
+        decay_applied = meta.get("last_decay_applied")
+        if not dry_run and decay_applied and now - _parse_timestamp(decay_applied) < DECAY_MIN_INTERVAL:
+            stats["unchanged"] += 1
+            return
+
         # Calculate days since last access
-        last_accessed_str = meta.get("last_accessed") or meta.get("created_at")
-        if last_accessed_str:
-            last_accessed = datetime.fromisoformat(last_accessed_str.replace("Z", "+00:00")).replace(tzinfo=None)
-            days_since_access = (datetime.utcnow() - last_accessed).days
-        else:
+        days_since_access = _days_since_access(meta, now, now_epoch)
+        if days_since_access is None:
             days_since_access = decay_days  # Assume decay if no access time
 
         if days_since_access < 1:
             stats["unchanged"] += 1
             return
 
-        # Calculate decay factor
-        # Exponential decay: confidence *= 0.99 ^ days
-        decay_factor = 0.99 ** days_since_access
-
-        # Memories with positive feedback decay slower
-        positive = meta.get("positive_reinforcement", 0)
-        negative = meta.get("negative_reinforcement", 0)
-        total = meta.get("access_count", 1)
-
-        if total > 0:
-            positive_ratio = positive / total
-            # Scale decay factor: high positive_ratio = slower decay
-            decay_factor = decay_factor * (0.5 + 0.5 * positive_ratio)
-
         old_confidence = meta["confidence"]
-        new_confidence = old_confidence * decay_factor
-
-        # Apply minimum confidence floor
-        new_confidence = max(min_confidence, new_confidence)
+        new_confidence = _decayed_confidence(old_confidence, days_since_access,
+                                             meta.get("positive_reinforcement", 0),
+                                             meta.get("access_count", 1), min_confidence)
 
         if abs(new_confidence - old_confidence) > 0.001:
             stats["decayed"] += 1
 
             if not dry_run:
                 meta["confidence"] = round(new_confidence, 3)
+                meta["last_decay_applied"] = now_iso
 
                 # Archive if below threshold
                 if new_confidence <= min_confidence:
@@ -192,42 +434,68 @@ def apply_confidence_decay(dry_run: bool = False) -> dict:
                     print(f"  Decayed: {memory_id} ({old_confidence:.3f} -> {new_confidence:.3f}, {days_since_access} days)")
 
                 # Save memory
-                project_path = memory.get("scope", {}).get("path")
-                project_hash = get_project_hash(project_path) if project_path else None
-                memory_path = get_memory_path(memory_id, project_hash)
-
-                with open(memory_path, 'w') as f:
-                    json.dump(memory, f, indent=2)
+                dirty[memory_id] = memory
 
                 # Update index entry
                 entry["confidence"] = meta["confidence"]
+                entry["status"] = meta.get("status", "active")
             else:
                 action = "Would archive" if new_confidence <= min_confidence else "Would decay"
                 print(f"  {action}: {memory_id} ({old_confidence:.3f} -> {new_confidence:.3f}, {days_since_access} days)")
         else:
             stats["unchanged"] += 1
 
-    # Process global memories
-    for entry in index["memories"]["global"]:
-        process_memory(entry["id"], entry)
-
-    # Process project memories
+    # Global memories, then project memories
+    entries = list(index["memories"]["global"])
     for project in index["memories"]["projects"].values():
-        for entry in project.get("memories", []):
-            process_memory(entry["id"], entry)
+        entries.extend(project.get("memories", []))
+
+    # Most memories don't change on a given run; settle those from the
+    # index and only load the ones that may decay
+    pending = []
+    for entry in entries:
+        if _unchanged_by_decay(entry, now, now_epoch, min_confidence):
+            stats["processed"] += 1
+            stats["unchanged"] += 1
+        else:
+            pending.append(entry)
+
+    # Memories already queued (changed, not yet written) are used as is
+    queued = [dirty.get(entry["id"]) for entry in pending]
+    loaded = iter(_map_io(load_memory, [entry["id"] for entry, memory in zip(pending, queued)
+                                        if memory is None]))
+    for entry, memory in zip(pending, queued):
+        process_memory(entry["id"], entry, memory if memory is not None else next(loaded))
 
     if not dry_run:
-        save_index(index)
+        # Persist decayed memories and the index in one batch; the index
+        # is only rewritten when something actually decayed
+        if dirty and own_dirty:
+            _flush_memories(dirty)
+            if own_index:
+                save_index(index)
+
+        config["last_decay_run"] = now_iso
+        if own_config:
+            _record_decay_run(now_iso)
 
     return stats
 
 
-def process_pending_feedback() -> dict:
+def process_pending_feedback(*, index: dict = None, dirty: dict = None) -> dict:
     """
     Process all pending feedback entries from feedback.jsonl.
 
+    Args:
+        index: Loaded index to update in place; the caller saves it.
+            Loaded and saved here when omitted.
+        dirty: Queue of changed memories (memory ID -> memory) left for the
+            caller to write. Written here when omitted; otherwise the
+            caller also writes FEEDBACK_MARKER once the queue is on disk.
+
     Returns:
-        Statistics about processed feedback
+        Statistics about processed feedback. "resume_offset" holds the new
+        FEEDBACK_MARKER offset when the marker needs updating.
     """
     stats = {
         "processed": 0,
@@ -240,39 +508,75 @@ def process_pending_feedback() -> dict:
         return stats
 
     # Track which feedback entries have been processed
-    processed_marker = Path(__file__).parent.parent / ".feedback_processed"
+    offset = 0
     last_processed = None
 
-    if processed_marker.exists():
-        with open(processed_marker, 'r') as f:
-            last_processed = f.read().strip()
+    if FEEDBACK_MARKER.exists():
+        with open(FEEDBACK_MARKER, 'r') as f:
+            marker = f.read().strip()
+        if marker.isdigit():
+            offset = int(marker)
+        else:
+            last_processed = marker
+
+    new_data = b""
+
+    with open(FEEDBACK_FILE, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if offset > size:
+            offset = 0  # File was truncated or replaced, start over
+        end = offset
+
+        if size > offset:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Only complete lines; a partly written last line is read next run
+                last_newline = mm.rfind(b"\n", offset)
+                if last_newline >= 0:
+                    end = last_newline + 1
+                    if last_processed:
+                        offset = _first_line_after(mm, offset, end, last_processed)
+                    new_data = mm[offset:end]
 
     entries_to_process = []
 
-    with open(FEEDBACK_FILE, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-
-            try:
-                entry = json.loads(line)
+    for line in new_data.split(b"\n"):
+        line = line.strip()
+        if not line or line.startswith(b'#'):
+            continue
 
-                # Skip already processed
-                if last_processed and entry.get("timestamp", "") <= last_processed:
-                    continue
+        try:
+            entry = _json_loads(line)
 
-                entries_to_process.append(entry)
-            except json.JSONDecodeError:
-                stats["errors"] += 1
+            # Skip already processed (legacy timestamp marker)
+            if last_processed and entry.get("timestamp", "") <= last_processed:
                 continue
 
+            entries_to_process.append(entry)
+        except ValueError:  # Invalid JSON or encoding
+            stats["errors"] += 1
+            continue
+
     if not entries_to_process:
+        if end != offset or last_processed:
+            stats["resume_offset"] = end
+            if dirty is None:
+                FEEDBACK_MARKER.write_text(str(end))
         print("No new feedback to process")
         return stats
 
     print(f"Processing {len(entries_to_process)} feedback entries...")
 
+    # Load the index once for the whole batch instead of once per entry,
+    # and write each changed memory once at the end
+    own_index = index is None
+    if own_index:
+        index = load_index()
+    lookup = _build_id_lookup(index)
+
+    own_dirty = dirty is None
+    if own_dirty:
+        dirty = {}
+
     for entry in entries_to_process:
         memory_id = entry.get("memory_id")
         outcome = entry.get("outcome")
@@ -285,14 +589,16 @@ def process_pending_feedback() -> dict:
         print(f"Processing: {memory_id} -> {outcome}")
 
         try:
-            if adjust_confidence(memory_id, outcome):
+            if adjust_confidence(memory_id, outcome, index=index, lookup=lookup, dirty=dirty):
                 stats["processed"] += 1
 
                 # Handle correction type feedback
                 if feedback_type == "correction" and entry.get("auto_creates_memory"):
-                    # Import here to avoid circular import issues
-                    sys.path.insert(0, str(Path(__file__).parent / "lib"))
-                    from memory_lib import create_correction_memory
+                    # Creating a memory updates index.json (and may read the
+                    # memory): save ours first and pick the new index up
+                    # afterwards, in place since callers may hold it
+                    _flush_memories(dirty)
+                    save_index(index)
 
                     correction_text = entry.get("feedback", "Correction applied")
                     correct_action = entry.get("correct_action", "Use the corrected approach")
@@ -304,6 +610,9 @@ def process_pending_feedback() -> dict:
                         entry.get("session_id")
                     )
 
+                    index.update(load_index())
+                    lookup = _build_id_lookup(index)
+
                     if new_id:
                         stats["corrections_created"] += 1
                         print(f"  + Created correction memory: {new_id}")
@@ -314,15 +623,64 @@ def process_pending_feedback() -> dict:
             print(f"  Error: {e}")
             stats["errors"] += 1
 
-    # Update last processed timestamp
-    if entries_to_process:
-        last_timestamp = max(e.get("timestamp", "") for e in entries_to_process)
-        with open(processed_marker, 'w') as f:
-            f.write(last_timestamp)
+    # Single save for the batch (nothing to save if every entry failed)
+    if own_dirty:
+        _flush_memories(dirty)
+    if own_index and stats["processed"]:
+        save_index(index)
+
+    # Update last processed offset, unless the caller still has to write
+    # the queued memories
+    stats["resume_offset"] = end
+    if own_dirty:
+        FEEDBACK_MARKER.write_text(str(end))
 
     return stats
 
 
+def run_maintenance(dry_run: bool = False) -> tuple:
+    """
+    Process pending feedback, then apply confidence decay, in one pass.
+
+    Both steps share one loaded index and one queue of changed memories,
+    so the index is saved and each changed memory written once at the end.
+
+    Args:
+        dry_run: If True, preview decay without applying it (feedback is
+            still applied)
+
+    Returns:
+        (feedback stats, decay stats)
+    """
+    index = load_index()
+    config = load_config()
+    last_decay_run = config.get("last_decay_run")
+    dirty = {}
+
+    print("1. Processing feedback...")
+    feedback_stats = process_pending_feedback(index=index, dirty=dirty)
+    print(f"   Processed: {feedback_stats['processed']}, Corrections: {feedback_stats['corrections_created']}\n")
+
+    print("2. Applying confidence decay...")
+    decay_stats = apply_confidence_decay(dry_run=dry_run, index=index, dirty=dirty, config=config)
+    print(f"   Processed: {decay_stats['processed']}, Decayed: {decay_stats['decayed']}, Archived: {decay_stats['archived']}\n")
+
+    # Anything queued changed the index too (corrections save as they go)
+    if dirty:
+        _flush_memories(dirty)
+        save_index(index)
+
+    # Mark the feedback processed only once its results are on disk
+    if "resume_offset" in feedback_stats:
+        FEEDBACK_MARKER.write_text(str(feedback_stats["resume_offset"]))
+
+    # Record the decay run only once its results are on disk
+    if config.get("last_decay_run") != last_decay_run:
+        _record_decay_run(config["last_decay_run"])
+
+    return feedback_stats, decay_stats
+
+
 def main():
     import argparse
 
@@ -332,7 +690,7 @@ def main():
     parser.add_argument("--decay", "-d", action="store_true",
                         help="Apply confidence decay to all memories")
     parser.add_argument("--dry-run", "-n", action="store_true",
-                        help="Show what would happen without making changes")
+                        help="Preview decay without making changes (ignores the once-a-day limit)")
     parser.add_argument("--feedback", "-f", action="store_true",
                         help="Process pending feedback from feedback.jsonl")
     parser.add_argument("--all", action="store_true",
@@ -377,15 +735,7 @@ def main():
 
     elif args.all:
         print("Running all maintenance operations...\n")
-
-        print("1. Processing feedback...")
-        feedback_stats = process_pending_feedback()
-        print(f"   Processed: {feedback_stats['processed']}, Corrections: {feedback_stats['corrections_created']}\n")
-
-        print("2. Applying confidence decay...")
-        decay_stats = apply_confidence_decay(dry_run=False)
-        print(f"   Processed: {decay_stats['processed']}, Decayed: {decay_stats['decayed']}, Archived: {decay_stats['archived']}\n")
-
+        run_maintenance()
         print("Maintenance complete.")
 
     else: